@@ -13,23 +13,34 @@ Response headers:
 - X-API-Deprecated: Present if requested version is deprecated
 """
 
+import calendar
+import functools
 import re
-from collections.abc import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # Supported API versions (newest first) - using date format YYYY-MM-DD
 SUPPORTED_VERSIONS = ["2026-01-20"]
 DEFAULT_VERSION = "2026-01-20"
 DEPRECATED_VERSIONS: set[str] = set()  # Add deprecated versions here as needed
 
+# Set view of SUPPORTED_VERSIONS for the per-request membership check
+_SUPPORTED_VERSION_SET = frozenset(SUPPORTED_VERSIONS)
+
+# X-API-Supported-Versions value, identical on every response
+_SUPPORTED_VERSIONS_HEADER = ", ".join(SUPPORTED_VERSIONS)
+
 # Version pattern: YYYY-MM-DD date format
 VERSION_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
-# Request context for storing version info
-_request_version: dict[int, str] = {}
+# Days per month in a non-leap year
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Request state attribute holding the negotiated version
+_STATE_KEY = "api_version"
 
 
 def get_api_version(request: Request) -> str:
@@ -43,30 +54,37 @@ def get_api_version(request: Request) -> str:
     Returns:
         The API version string being used for this request
     """
-    return _request_version.get(id(request), DEFAULT_VERSION)
+    return getattr(request.state, _STATE_KEY, DEFAULT_VERSION)
 
 
+@functools.lru_cache(maxsize=256)
 def _is_valid_date(version: str) -> bool:
     """Check if the version string is a valid date.
 
+    Clients resend the same header value on every request, so results are
+    memoized.
+
     Args:
         version: Version string in YYYY-MM-DD format
 
     Returns:
         True if the date is valid
     """
+    if len(version) != 10 or version[4] != "-" or version[7] != "-":
+        return False
     try:
-        year, month, day = map(int, version.split("-"))
-        # Basic validation
-        if year < 2020 or year > 2100:
-            return False
-        if month < 1 or month > 12:
-            return False
-        if day < 1 or day > 31:
-            return False
-        return True
-    except (ValueError, AttributeError):
+        year, month, day = int(version[:4]), int(version[5:7]), int(version[8:])
+    except ValueError:
+        return False
+
+    # Basic validation
+    if year < 2020 or year > 2100:
+        return False
+    if month < 1 or month > 12:
         return False
+    if month == 2 and calendar.isleap(year):
+        return 1 <= day <= 29
+    return 1 <= day <= _DAYS_IN_MONTH[month - 1]
 
 
 def _find_best_version(requested: str) -> str | None:
@@ -81,12 +99,12 @@ def _find_best_version(requested: str) -> str | None:
     Returns:
         The matching supported version, or None if no match
     """
-    if requested in SUPPORTED_VERSIONS:
+    if requested in _SUPPORTED_VERSION_SET:
         return requested
     return None
 
 
-class APIVersionMiddleware(BaseHTTPMiddleware):
+class APIVersionMiddleware:
     """Middleware for handling API version headers.
 
     This middleware:
@@ -95,14 +113,24 @@ class APIVersionMiddleware(BaseHTTPMiddleware):
     3. Sets response headers with version information
     4. Returns 400 for invalid version format
     5. Returns 406 for unsupported versions
+
+    It is a plain ASGI middleware rather than a BaseHTTPMiddleware, so
+    responses (including SSE streams) are passed straight through instead
+    of being relayed over an extra task and memory channel.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process the request and handle versioning."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Extract version from headers (X-API-Version takes precedence)
-        requested_version = request.headers.get("X-API-Version") or request.headers.get(
-            "API-Version"
-        )
+        headers = Headers(scope=scope)
+        requested_version = headers.get("X-API-Version") or headers.get("API-Version")
 
         # Default to current version if no header provided
         if not requested_version:
@@ -110,7 +138,7 @@ class APIVersionMiddleware(BaseHTTPMiddleware):
         else:
             # Validate version format (YYYY-MM-DD)
             if not VERSION_PATTERN.match(requested_version):
-                return JSONResponse(
+                response = JSONResponse(
                     status_code=400,
                     content={
                         "error": "Invalid Version Format",
@@ -121,10 +149,12 @@ class APIVersionMiddleware(BaseHTTPMiddleware):
                         "supported_versions": SUPPORTED_VERSIONS,
                     },
                 )
+                await response(scope, receive, send)
+                return
 
             # Validate it's a reasonable date
             if not _is_valid_date(requested_version):
-                return JSONResponse(
+                response = JSONResponse(
                     status_code=400,
                     content={
                         "error": "Invalid Version Date",
@@ -133,12 +163,14 @@ class APIVersionMiddleware(BaseHTTPMiddleware):
                         "supported_versions": SUPPORTED_VERSIONS,
                     },
                 )
+                await response(scope, receive, send)
+                return
 
             # Find matching version
             version_to_use = _find_best_version(requested_version)
 
             if not version_to_use:
-                return JSONResponse(
+                response = JSONResponse(
                     status_code=406,
                     content={
                         "error": "Unsupported API Version",
@@ -149,27 +181,28 @@ class APIVersionMiddleware(BaseHTTPMiddleware):
                         "default_version": DEFAULT_VERSION,
                     },
                 )
-
-        # Store version in request context for route handlers
-        _request_version[id(request)] = version_to_use
-
-        try:
-            # Process the request
-            response = await call_next(request)
-
-            # Add version headers to response
-            response.headers["X-API-Version"] = version_to_use
-            response.headers["X-API-Supported-Versions"] = ", ".join(SUPPORTED_VERSIONS)
-
-            # Add deprecation warning if applicable
-            if version_to_use in DEPRECATED_VERSIONS:
-                response.headers["X-API-Deprecated"] = "true"
-                response.headers["X-API-Deprecation-Notice"] = (
-                    f"API version {version_to_use} is deprecated. "
-                    f"Please upgrade to {DEFAULT_VERSION}."
+                await response(scope, receive, send)
+                return
+
+        # Store version in request state for route handlers
+        scope.setdefault("state", {})[_STATE_KEY] = version_to_use
+
+        async def send_with_version(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add version headers to response
+                response_headers = MutableHeaders(scope=message)
+                response_headers["X-API-Version"] = version_to_use
+                response_headers["X-API-Supported-Versions"] = (
+                    _SUPPORTED_VERSIONS_HEADER
                 )
 
-            return response
-        finally:
-            # Clean up request context
-            _request_version.pop(id(request), None)
+                # Add deprecation warning if applicable
+                if version_to_use in DEPRECATED_VERSIONS:
+                    response_headers["X-API-Deprecated"] = "true"
+                    response_headers["X-API-Deprecation-Notice"] = (
+                        f"API version {version_to_use} is deprecated. "
+                        f"Please upgrade to {DEFAULT_VERSION}."
+                    )
+            await send(message)
+
+        await self.app(scope, receive, send_with_version)
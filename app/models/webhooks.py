@@ -1,9 +1,10 @@
 """Webhook registration and event models."""
 
+import base64
 from datetime import datetime
-from typing import Annotated, Literal
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, PrivateAttr
 
 # Event type literals
 EventType = Literal["match.completed", "team_member.transferred"]
@@ -64,6 +65,20 @@ class RegisteredWebhook(BaseModel):
         examples=["whsec_abc123def456..."],
     )
 
+    # Raw HMAC key decoded from `secret` once per instance, so signing a
+    # delivery needs neither the whsec_ prefix strip nor a base64 decode
+    _signing_key: bytes = PrivateAttr()
+
+    def model_post_init(self, context: Any, /) -> None:
+        # Derived here rather than set by the service so webhooks rebuilt
+        # from a dump (e.g. by a shared store) still sign correctly
+        self._signing_key = base64.b64decode(self.secret.removeprefix("whsec_"))
+
+    @property
+    def signing_key(self) -> bytes:
+        """The raw HMAC-SHA256 key for signing deliveries to this webhook."""
+        return self._signing_key
+
 
 class WebhookRegistrationResponse(BaseModel):
     """Response after registering a webhook."""
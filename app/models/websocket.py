@@ -366,6 +366,10 @@ class BaseClientMessage(BaseModel):
 
     action: str = Field(description="Action to perform")
 
+    # No route validates client messages yet, so don't build their schemas
+    # at import; pydantic builds them on first use
+    model_config = {"defer_build": True}
+
 
 class PingMessage(BaseClientMessage):
     """Ping message for keep-alive."""
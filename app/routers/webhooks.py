@@ -72,7 +72,7 @@ async def register_webhook(
     request: WebhookRegistrationRequest,
 ) -> WebhookRegistrationResponse:
     """Register a new webhook endpoint."""
-    webhook = webhook_service.register_webhook(
+    webhook = await webhook_service.register_webhook(
         url=str(request.url),
         event_types=request.event_types,
         description=request.description,
@@ -93,7 +93,7 @@ async def register_webhook(
 )
 async def list_webhooks() -> list[RegisteredWebhook]:
     """List all registered webhooks."""
-    return webhook_service.list_webhooks()
+    return await webhook_service.list_webhooks()
 
 
 @router.get(
@@ -116,7 +116,7 @@ async def list_webhooks() -> list[RegisteredWebhook]:
 )
 async def get_webhook(webhook_id: str) -> RegisteredWebhook:
     """Get a specific webhook by ID."""
-    webhook = webhook_service.get_webhook(webhook_id)
+    webhook = await webhook_service.get_webhook(webhook_id)
     if webhook is None:
         raise HTTPException(
             status_code=404,
@@ -148,7 +148,7 @@ async def get_webhook(webhook_id: str) -> RegisteredWebhook:
 )
 async def delete_webhook(webhook_id: str) -> dict:
     """Delete a webhook endpoint."""
-    deleted = webhook_service.delete_webhook(webhook_id)
+    deleted = await webhook_service.delete_webhook(webhook_id)
     if not deleted:
         raise HTTPException(
             status_code=404,
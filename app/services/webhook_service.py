@@ -3,10 +3,11 @@
 import base64
 import hashlib
 import hmac
+import json
 import secrets
-import time
 import uuid
 from datetime import datetime, timezone
+from typing import Protocol
 
 import httpx
 
@@ -22,8 +23,75 @@ from app.models.webhooks import (
     WebhookEventPayload,
 )
 
+
+class WebhookStore(Protocol):
+    """Storage backend for registered webhooks.
+
+    The default backend is process-local. Deployments running several
+    workers can plug in a shared backend via set_webhook_store(); methods
+    are coroutines so a network-backed store never blocks the event loop.
+    """
+
+    async def add(self, webhook: RegisteredWebhook) -> None: ...
+
+    async def get(self, webhook_id: str) -> RegisteredWebhook | None: ...
+
+    async def all(self) -> list[RegisteredWebhook]: ...
+
+    async def remove(self, webhook_id: str) -> RegisteredWebhook | None: ...
+
+    async def for_event(
+        self, event_type: EventType
+    ) -> tuple[RegisteredWebhook, ...]: ...
+
+
+class InMemoryWebhookStore:
+    """In-memory webhook storage with a per-event-type subscriber index."""
+
+    def __init__(self) -> None:
+        self._webhooks: dict[str, RegisteredWebhook] = {}
+        # Immutable per-event-type subscriber snapshots. Rebuilt
+        # (copy-on-write) on every add/remove so deliveries can iterate
+        # without copying and never observe a half-updated registry.
+        self._by_event: dict[EventType, tuple[RegisteredWebhook, ...]] = dict.fromkeys(
+            ALL_EVENT_TYPES, ()
+        )
+
+    def _rebuild_event_index(self, event_types: list[EventType]) -> None:
+        """Swap in fresh subscriber tuples for the given event types."""
+        for event_type in event_types:
+            self._by_event[event_type] = tuple(
+                wh for wh in self._webhooks.values() if event_type in wh.event_types
+            )
+
+    async def add(self, webhook: RegisteredWebhook) -> None:
+        self._webhooks[webhook.id] = webhook
+        self._rebuild_event_index(webhook.event_types)
+
+    async def get(self, webhook_id: str) -> RegisteredWebhook | None:
+        return self._webhooks.get(webhook_id)
+
+    async def all(self) -> list[RegisteredWebhook]:
+        return list(self._webhooks.values())
+
+    async def remove(self, webhook_id: str) -> RegisteredWebhook | None:
+        webhook = self._webhooks.pop(webhook_id, None)
+        if webhook is not None:
+            self._rebuild_event_index(webhook.event_types)
+        return webhook
+
+    async def for_event(self, event_type: EventType) -> tuple[RegisteredWebhook, ...]:
+        return self._by_event[event_type]
+
+
 # In-memory storage for registered webhooks
-_webhooks: dict[str, RegisteredWebhook] = {}
+_store: WebhookStore = InMemoryWebhookStore()
+
+
+def set_webhook_store(store: WebhookStore) -> None:
+    """Replace the webhook storage backend."""
+    global _store
+    _store = store
 
 
 def generate_webhook_id() -> str:
@@ -37,7 +105,7 @@ def generate_webhook_secret() -> str:
     return f"whsec_{base64.b64encode(secret_bytes).decode()}"
 
 
-def register_webhook(
+async def register_webhook(
     url: str,
     event_types: list[EventType] | None = None,
     description: str | None = None,
@@ -59,128 +127,126 @@ def register_webhook(
         secret=secret,
     )
 
-    _webhooks[webhook_id] = webhook
+    await _store.add(webhook)
     return webhook
 
 
-def get_webhook(webhook_id: str) -> RegisteredWebhook | None:
+async def get_webhook(webhook_id: str) -> RegisteredWebhook | None:
     """Get a webhook by ID."""
-    return _webhooks.get(webhook_id)
+    return await _store.get(webhook_id)
 
 
-def list_webhooks() -> list[RegisteredWebhook]:
+async def list_webhooks() -> list[RegisteredWebhook]:
     """List all registered webhooks."""
-    return list(_webhooks.values())
+    return await _store.all()
 
 
-def delete_webhook(webhook_id: str) -> bool:
+async def delete_webhook(webhook_id: str) -> bool:
     """Delete a webhook by ID. Returns True if deleted, False if not found."""
-    if webhook_id in _webhooks:
-        del _webhooks[webhook_id]
-        return True
-    return False
+    return await _store.remove(webhook_id) is not None
+
 
+async def get_webhooks_for_event(
+    event_type: EventType,
+) -> tuple[RegisteredWebhook, ...]:
+    """Get all webhooks subscribed to a specific event type.
 
-def get_webhooks_for_event(event_type: EventType) -> list[RegisteredWebhook]:
-    """Get all webhooks subscribed to a specific event type."""
-    return [wh for wh in _webhooks.values() if event_type in wh.event_types]
+    Returns the current immutable snapshot; it is safe to iterate across
+    awaits even if webhooks are registered or deleted concurrently.
+    """
+    return await _store.for_event(event_type)
 
 
-def compute_signature(payload: str, secret: str, timestamp: int) -> str:
+def compute_signature(payload: bytes, key: bytes, timestamp: int) -> str:
     """
     Compute webhook signature using Standard Webhooks specification.
 
-    The signature is computed as HMAC-SHA256 of "{webhook_id}.{timestamp}.{payload}"
+    The signature is computed as HMAC-SHA256 of "{timestamp}.{payload}",
+    keyed with the raw (base64-decoded, unprefixed) webhook secret.
     """
-    # Remove whsec_ prefix if present
-    if secret.startswith("whsec_"):
-        secret = secret[6:]
-
-    # Decode the base64 secret
-    secret_bytes = base64.b64decode(secret)
-
-    # Create the signed payload: timestamp.payload
-    signed_payload = f"{timestamp}.{payload}"
-
-    # Compute HMAC-SHA256
-    signature = hmac.new(
-        secret_bytes,
-        signed_payload.encode("utf-8"),
-        hashlib.sha256,
-    ).digest()
+    # Feed the signed payload (timestamp.payload) to HMAC-SHA256 in pieces so
+    # the payload bytes are never copied into a concatenated message
+    mac = hmac.new(key, b"%d." % timestamp, hashlib.sha256)
+    mac.update(payload)
+    signature = mac.digest()
 
     # Return base64 encoded signature with v1 prefix
     return f"v1,{base64.b64encode(signature).decode()}"
 
 
+# Known-valid sample event data, validated once at import. Per-call samples
+# only swap in fresh IDs/timestamps and skip re-validation via model_construct.
+_MATCH_COMPLETED_TEMPLATE = MatchCompletedData(
+    match_id="match-00000000",
+    home_team_id="afc-richmond",
+    away_team_id="west-ham-united",
+    home_score=2,
+    away_score=1,
+    result="home_win",
+    match_type="league",
+    completed_at=datetime.now(timezone.utc),
+    man_of_the_match="Jamie Tartt",
+    lesson_learned="Every game is a chance to believe in something bigger than yourself.",
+    ted_post_match_quote="You know what the happiest animal on Earth is? It's a goldfish. Y'know why? Got a 10-second memory.",
+).model_dump()
+
+_TEAM_MEMBER_TRANSFERRED_TEMPLATE = TeamMemberTransferredData(
+    team_member_id="tm-00000000",
+    character_id="dani-rojas",
+    character_name="Dani Rojas",
+    member_type="player",
+    transfer_type="joined",
+    team_id="afc-richmond",
+    team_name="AFC Richmond",
+    previous_team_id="guadalajara-fc",
+    previous_team_name="Guadalajara FC",
+    years_with_previous_team=3,
+    transfer_fee_gbp="8000000.00",
+    ted_reaction="Football is life! And so is welcoming new friends to the family!",
+).model_dump()
+
+
 def generate_sample_payload(event_type: EventType) -> WebhookEventPayload:
     """Generate a sample payload for testing."""
     if event_type == "match.completed":
-        return MatchCompletedPayload(
-            event_type="match.completed",
-            data=MatchCompletedData(
-                match_id=f"match-{secrets.token_hex(4)}",
-                home_team_id="afc-richmond",
-                away_team_id="west-ham-united",
-                home_score=2,
-                away_score=1,
-                result="home_win",
-                match_type="league",
-                completed_at=datetime.now(timezone.utc),
-                man_of_the_match="Jamie Tartt",
-                lesson_learned="Every game is a chance to believe in something bigger than yourself.",
-                ted_post_match_quote="You know what the happiest animal on Earth is? It's a goldfish. Y'know why? Got a 10-second memory.",
-            ),
+        data = MatchCompletedData.model_construct(
+            **{
+                **_MATCH_COMPLETED_TEMPLATE,
+                "match_id": f"match-{secrets.token_hex(4)}",
+                "completed_at": datetime.now(timezone.utc),
+            }
+        )
+        return MatchCompletedPayload.model_construct(
+            event_type="match.completed", data=data
         )
     else:  # team_member.transferred
-        return TeamMemberTransferredPayload(
-            event_type="team_member.transferred",
-            data=TeamMemberTransferredData(
-                team_member_id=f"tm-{secrets.token_hex(4)}",
-                character_id="dani-rojas",
-                character_name="Dani Rojas",
-                member_type="player",
-                transfer_type="joined",
-                team_id="afc-richmond",
-                team_name="AFC Richmond",
-                previous_team_id="guadalajara-fc",
-                previous_team_name="Guadalajara FC",
-                years_with_previous_team=3,
-                transfer_fee_gbp="8000000.00",
-                ted_reaction="Football is life! And so is welcoming new friends to the family!",
-            ),
+        data = TeamMemberTransferredData.model_construct(
+            **{
+                **_TEAM_MEMBER_TRANSFERRED_TEMPLATE,
+                "team_member_id": f"tm-{secrets.token_hex(4)}",
+            }
+        )
+        return TeamMemberTransferredPayload.model_construct(
+            event_type="team_member.transferred", data=data
         )
 
 
 async def deliver_webhook(
     webhook: RegisteredWebhook,
     event_id: str,
-    event_type: EventType,
-    payload: WebhookEventPayload,
+    payload_bytes: bytes,
+    timestamp: int,
 ) -> WebhookDeliveryResult:
     """
-    Deliver a webhook event to a single endpoint.
+    Deliver a serialized webhook event to a single endpoint.
 
     Uses Standard Webhooks specification for signatures:
     - webhook-id: Unique message ID
     - webhook-timestamp: Unix timestamp
     - webhook-signature: HMAC-SHA256 signature
     """
-    # Build the full event payload
-    timestamp = int(time.time())
-    full_payload = {
-        "event_type": event_type,
-        "event_id": event_id,
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "data": payload.data.model_dump(mode="json"),
-    }
-
-    import json
-
-    payload_str = json.dumps(full_payload, separators=(",", ":"), sort_keys=True)
-
     # Compute signature
-    signature = compute_signature(payload_str, webhook.secret, timestamp)
+    signature = compute_signature(payload_bytes, webhook.signing_key, timestamp)
 
     # Prepare headers per Standard Webhooks spec
     headers = {
@@ -194,7 +260,7 @@ async def deliver_webhook(
         async with httpx.AsyncClient(timeout=10.0) as client:
             response = await client.post(
                 str(webhook.url),
-                content=payload_str,
+                content=payload_bytes,
                 headers=headers,
             )
 
@@ -234,17 +300,34 @@ async def trigger_event(
     """
     event_id = f"evt_{uuid.uuid4().hex[:24]}"
 
+    # Get all webhooks subscribed to this event type; with none, there is
+    # nothing to serialize or sign
+    webhooks = await get_webhooks_for_event(event_type)
+    if not webhooks:
+        return event_id, []
+
     # Use provided payload or generate a sample one
     if payload is None:
         payload = generate_sample_payload(event_type)
 
-    # Get all webhooks subscribed to this event type
-    webhooks = get_webhooks_for_event(event_type)
+    # Build the full event payload once; every subscriber receives the same
+    # event, so they share one timestamp and one serialized body
+    now = datetime.now(timezone.utc)
+    timestamp = int(now.timestamp())
+    full_payload = {
+        "event_type": event_type,
+        "event_id": event_id,
+        "created_at": now.isoformat(),
+        "data": payload.data.model_dump(mode="json"),
+    }
+    payload_bytes = json.dumps(
+        full_payload, separators=(",", ":"), sort_keys=True
+    ).encode("utf-8")
 
     # Deliver to each webhook
     results = []
     for webhook in webhooks:
-        result = await deliver_webhook(webhook, event_id, event_type, payload)
+        result = await deliver_webhook(webhook, event_id, payload_bytes, timestamp)
         results.append(result)
 
     return event_id, results
@@ -1,9 +1,6 @@
 """Tests for the characters router."""
 
-import pytest
 
-
-@pytest.mark.asyncio
 async def test_list_characters(client):
     """Test listing all characters."""
     response = await client.get("/characters")
@@ -25,7 +22,6 @@ async def test_list_characters(client):
     assert "Ted Lasso" in names
 
 
-@pytest.mark.asyncio
 async def test_list_characters_filter_by_role(client):
     """Test filtering characters by role."""
     response = await client.get("/characters?role=coach")
@@ -34,7 +30,6 @@ async def test_list_characters_filter_by_role(client):
     assert all(c["role"] == "coach" for c in data)
 
 
-@pytest.mark.asyncio
 async def test_list_characters_filter_by_team(client):
     """Test filtering characters by team."""
     response = await client.get("/characters?team_id=afc-richmond")
@@ -43,7 +38,6 @@ async def test_list_characters_filter_by_team(client):
     assert all(c["team_id"] == "afc-richmond" for c in data)
 
 
-@pytest.mark.asyncio
 async def test_list_characters_filter_by_optimism(client):
     """Test filtering characters by minimum optimism."""
     response = await client.get("/characters?min_optimism=80")
@@ -52,7 +46,6 @@ async def test_list_characters_filter_by_optimism(client):
     assert all(c["emotional_stats"]["optimism"] >= 80 for c in data)
 
 
-@pytest.mark.asyncio
 async def test_list_characters_pagination(client):
     """Test pagination parameters."""
     # Test with custom limit
@@ -71,7 +64,6 @@ async def test_list_characters_pagination(client):
     assert result["limit"] == 2
 
 
-@pytest.mark.asyncio
 async def test_get_character(client):
     """Test getting a specific character."""
     response = await client.get("/characters/ted-lasso")
@@ -84,14 +76,12 @@ async def test_get_character(client):
     assert "signature_quotes" in data
 
 
-@pytest.mark.asyncio
 async def test_get_character_not_found(client):
     """Test getting a non-existent character."""
     response = await client.get("/characters/nonexistent")
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_create_character(client, sample_character):
     """Test creating a new character."""
     response = await client.post("/characters", json=sample_character)
@@ -101,7 +91,6 @@ async def test_create_character(client, sample_character):
     assert data["id"] == "test-character"
 
 
-@pytest.mark.asyncio
 async def test_create_character_duplicate(client, sample_character):
     """Test creating a duplicate character fails."""
     # First creation should succeed
@@ -111,7 +100,6 @@ async def test_create_character_duplicate(client, sample_character):
     assert response.status_code == 409
 
 
-@pytest.mark.asyncio
 async def test_update_character(client):
     """Test updating a character."""
     response = await client.patch(
@@ -123,7 +111,6 @@ async def test_update_character(client):
     assert "updated" in data["personality_traits"]
 
 
-@pytest.mark.asyncio
 async def test_update_character_not_found(client):
     """Test updating a non-existent character."""
     response = await client.patch(
@@ -133,7 +120,6 @@ async def test_update_character_not_found(client):
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_get_character_quotes(client):
     """Test getting a character's quotes."""
     response = await client.get("/characters/ted-lasso/quotes")
@@ -143,7 +129,6 @@ async def test_get_character_quotes(client):
     assert len(data) > 0
 
 
-@pytest.mark.asyncio
 async def test_get_character_quotes_not_found(client):
     """Test getting quotes for a non-existent character."""
     response = await client.get("/characters/nonexistent/quotes")
@@ -1,9 +1,6 @@
 """Tests for the episodes router."""
 
-import pytest
 
-
-@pytest.mark.asyncio
 async def test_list_episodes(client):
     """Test listing all episodes."""
     response = await client.get("/episodes")
@@ -17,7 +14,6 @@ async def test_list_episodes(client):
     assert len(data) > 0
 
 
-@pytest.mark.asyncio
 async def test_list_episodes_filter_by_season(client):
     """Test filtering episodes by season."""
     response = await client.get("/episodes?season=1")
@@ -26,7 +22,6 @@ async def test_list_episodes_filter_by_season(client):
     assert all(e["season"] == 1 for e in data)
 
 
-@pytest.mark.asyncio
 async def test_list_episodes_filter_by_character(client):
     """Test filtering episodes by character focus."""
     response = await client.get("/episodes?character_focus=ted-lasso")
@@ -35,7 +30,6 @@ async def test_list_episodes_filter_by_character(client):
     assert all("ted-lasso" in e["character_focus"] for e in data)
 
 
-@pytest.mark.asyncio
 async def test_list_episodes_pagination(client):
     """Test pagination parameters."""
     response = await client.get("/episodes?limit=3")
@@ -45,7 +39,6 @@ async def test_list_episodes_pagination(client):
     assert result["limit"] == 3
 
 
-@pytest.mark.asyncio
 async def test_get_episode(client):
     """Test getting a specific episode."""
     response = await client.get("/episodes/s01e01")
@@ -56,14 +49,12 @@ async def test_get_episode(client):
     assert "ted_wisdom" in data
 
 
-@pytest.mark.asyncio
 async def test_get_episode_not_found(client):
     """Test getting a non-existent episode."""
     response = await client.get("/episodes/s99e99")
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_create_episode(client):
     """Test creating a new episode."""
     episode_data = {
@@ -87,7 +78,6 @@ async def test_create_episode(client):
     assert data["title"] == "Test Episode"
 
 
-@pytest.mark.asyncio
 async def test_update_episode(client):
     """Test updating an episode."""
     response = await client.patch(
@@ -99,7 +89,6 @@ async def test_update_episode(client):
     assert data["runtime_minutes"] == 35
 
 
-@pytest.mark.asyncio
 async def test_get_episode_wisdom(client):
     """Test getting episode wisdom."""
     response = await client.get("/episodes/s01e01/wisdom")
@@ -110,7 +99,6 @@ async def test_get_episode_wisdom(client):
     assert "memorable_moments" in data
 
 
-@pytest.mark.asyncio
 async def test_get_season_episodes(client):
     """Test getting all episodes from a season."""
     response = await client.get("/episodes/seasons/1")
@@ -122,7 +110,6 @@ async def test_get_season_episodes(client):
     assert all(e["season"] == 1 for e in data)
 
 
-@pytest.mark.asyncio
 async def test_get_season_episodes_not_found(client):
     """Test getting episodes from a non-existent season."""
     response = await client.get("/episodes/seasons/99")
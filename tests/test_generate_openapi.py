@@ -0,0 +1,313 @@
+"""Tests for the OpenAPI spec generation script."""
+
+import json
+
+import pytest
+
+from app.models.interactive import CommentaryEventType
+from app.models.websocket import LiveMatchEventType
+from scripts import generate_openapi
+from scripts.generate_openapi import (
+    _COMMENTARY_EVENT_TYPES,
+    _LIVE_MATCH_EVENT_TYPES,
+    EXTRA_SCHEMAS,
+    find_dangling_refs,
+    generate_openapi_spec,
+    main,
+    merge_paths,
+    serialize_msgpack,
+    serialize_spec,
+    source_hash,
+    static_fragments,
+    strip_descriptions,
+    validate_spec,
+    write_atomic,
+)
+
+
+def test_merge_paths():
+    """Test static paths are merged into the generated paths."""
+    paths = {"/teams": {"get": {"operationId": "list_teams"}}}
+    merge_paths(paths, {"/ws": {"get": {"operationId": "websocket"}}})
+    assert set(paths) == {"/teams", "/ws"}
+
+
+def test_merge_paths_duplicate_operation_id():
+    """Test a static path reusing a generated operationId is rejected."""
+    paths = {"/teams": {"get": {"operationId": "list_teams"}}}
+    with pytest.raises(ValueError, match="list_teams"):
+        merge_paths(paths, {"/ws": {"get": {"operationId": "list_teams"}}})
+
+
+def test_merge_paths_non_operation_fields():
+    """Test path-level fields such as parameters are not read as operations."""
+    paths = {"/teams": {"get": {"operationId": "list_teams"}}}
+    merge_paths(
+        paths,
+        {
+            "/ws": {
+                "summary": "Live updates",
+                "parameters": [],
+                "get": {"operationId": "websocket"},
+            }
+        },
+    )
+    assert paths["/ws"]["parameters"] == []
+
+
+def test_find_dangling_refs():
+    """Test unresolved $ref targets are reported."""
+    spec = {
+        "components": {"schemas": {"Team": {"type": "object"}}},
+        "paths": {
+            "/teams": {"get": {"schema": {"$ref": "#/components/schemas/Team"}}},
+            "/quotes": {"get": {"oneOf": [{"$ref": "#/components/schemas/Quote"}]}},
+        },
+    }
+    output = json.dumps(spec, indent=2).encode()
+    assert find_dangling_refs(spec, output) == {"#/components/schemas/Quote"}
+
+
+def test_serialize_spec_encoders_match(monkeypatch):
+    """Test orjson and the stdlib fallback write identical bytes."""
+    pytest.importorskip("orjson")
+    spec = {
+        "info": {"title": "Ted’s café", "version": "1.0.0"},
+        "paths": {"/quotes": {"get": {"summary": "Believe 🏆"}}},
+    }
+    with_orjson = serialize_spec(spec)
+    monkeypatch.setattr(generate_openapi, "orjson", None)
+
+    assert serialize_spec(spec) == with_orjson
+    assert "café".encode() in with_orjson
+
+
+def test_validate_spec(tmp_path, monkeypatch):
+    """Test the spec is checked against a meta-schema file."""
+    fastjsonschema = pytest.importorskip("fastjsonschema")
+    monkeypatch.setattr(generate_openapi, "CACHE_DIR", tmp_path / "cache")
+    meta_schema = tmp_path / "meta.json"
+    meta_schema.write_text(json.dumps({"type": "object", "required": ["openapi"]}))
+
+    validate_spec({"openapi": "3.1.0"}, meta_schema)
+    with pytest.raises(fastjsonschema.JsonSchemaValueException):
+        validate_spec({}, meta_schema)
+
+    # The compiled validator is cached and reused
+    assert len(list((tmp_path / "cache").glob("validator-*.py"))) == 1
+    with pytest.raises(fastjsonschema.JsonSchemaValueException):
+        validate_spec({}, meta_schema)
+
+    # A different fastjsonschema version compiles a fresh validator
+    monkeypatch.setattr(generate_openapi.metadata, "version", lambda name: "0.0.0")
+    validate_spec({"openapi": "3.1.0"}, meta_schema)
+    assert len(list((tmp_path / "cache").glob("validator-*.py"))) == 2
+
+
+def test_serialize_msgpack():
+    """Test the MessagePack output round-trips to the same spec."""
+    msgpack = pytest.importorskip("msgpack")
+    spec = {"openapi": "3.1.0", "paths": {"/teams": {}}}
+
+    assert msgpack.unpackb(serialize_msgpack(spec)) == spec
+
+
+def test_write_atomic(tmp_path):
+    """Test the output is replaced in place without leftover temp files."""
+    path = tmp_path / "openapi.json"
+    path.write_bytes(b"old")
+    path.chmod(0o640)
+
+    write_atomic(path, b"new")
+    assert path.read_bytes() == b"new"
+    assert path.stat().st_mode & 0o777 == 0o640
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_event_types_match_models():
+    """Test the static event_type enums stay in sync with the models."""
+    assert _LIVE_MATCH_EVENT_TYPES == tuple(LiveMatchEventType)
+    assert _COMMENTARY_EVENT_TYPES == tuple(CommentaryEventType)
+
+
+def test_strip_descriptions():
+    """Test property descriptions are dropped but names and examples kept."""
+    spec = {
+        "components": {
+            "schemas": {
+                "Event": {
+                    "description": "A match event",
+                    "properties": {
+                        "description": {"type": "string", "description": "What"},
+                        "minute": {"type": "integer", "description": "Minute"},
+                    },
+                    "example": {"description": "Goal!"},
+                }
+            }
+        }
+    }
+    strip_descriptions(spec)
+    assert spec["components"]["schemas"]["Event"] == {
+        "description": "A match event",
+        "properties": {
+            "description": {"type": "string"},
+            "minute": {"type": "integer"},
+        },
+        "example": {"description": "Goal!"},
+    }
+
+
+def test_generate_openapi_spec_force():
+    """Test the spec is memoized and force=True rebuilds it from the app."""
+    spec = generate_openapi_spec()
+    assert generate_openapi_spec() is spec
+
+    rebuilt = generate_openapi_spec(force=True)
+    assert rebuilt is not spec
+    assert rebuilt == spec
+
+
+def test_static_fragments():
+    """Test the static parts are the ones merged into the full spec."""
+    fragments = static_fragments()
+    spec = generate_openapi_spec()
+
+    for name, schema in fragments["components"]["schemas"].items():
+        assert spec["components"]["schemas"][name] is schema
+    for path, path_item in fragments["paths"].items():
+        assert spec["paths"][path] is path_item
+    assert spec["webhooks"] == fragments["webhooks"]
+    assert json.loads(serialize_spec(fragments)) == fragments
+
+
+def test_discriminator_mappings():
+    """Test discriminator mappings cover each oneOf member by its tag."""
+    for schema in EXTRA_SCHEMAS.values():
+        discriminator = schema.get("discriminator", {})
+        mapping = discriminator.get("mapping")
+        if not mapping:
+            continue
+        assert sorted(mapping.values()) == sorted(
+            ref["$ref"] for ref in schema["oneOf"]
+        )
+        for tag, target in mapping.items():
+            member = EXTRA_SCHEMAS[target.rsplit("/", 1)[-1]]
+            tag_schema = member["properties"][discriminator["propertyName"]]
+            assert tag_schema["enum"] == [tag]
+
+
+@pytest.fixture
+def spec_cache(tmp_path, monkeypatch):
+    """Point the generator at a throwaway source tree and cache directory.
+
+    Yields the list that records each _load_app() call.
+    """
+    root = tmp_path / "root"
+    (root / "app").mkdir(parents=True)
+    (root / "app" / "main.py").write_text("app = None\n")
+    descriptions = tmp_path / "descriptions"
+    descriptions.mkdir()
+    (descriptions / "live.md").write_text("Live match\n")
+    monkeypatch.setattr(generate_openapi, "ROOT", root)
+    monkeypatch.setattr(generate_openapi, "DESCRIPTIONS_DIR", descriptions)
+    monkeypatch.setattr(generate_openapi, "CACHE_DIR", tmp_path / "cache")
+
+    calls = []
+    load_app = generate_openapi._load_app
+
+    def counting_load_app():
+        calls.append(True)
+        return load_app()
+
+    def reset():
+        # Same reset as generate_openapi_spec(force=True), without counting it
+        generate_openapi._build_openapi_spec.cache_clear()
+        load_app().openapi_schema = None
+
+    reset()
+    monkeypatch.setattr(generate_openapi, "_load_app", counting_load_app)
+    yield calls
+    reset()
+
+
+def test_main_serves_second_run_from_cache(tmp_path, spec_cache):
+    """Test an unchanged source tree is served from the cache."""
+    first, second = tmp_path / "first.json", tmp_path / "second.json"
+
+    main(["-o", str(first)])
+    assert len(spec_cache) == 1
+    assert len(list((tmp_path / "cache").glob("*.json"))) == 1
+
+    main(["-o", str(second)])
+    assert len(spec_cache) == 1
+    assert second.read_bytes() == first.read_bytes()
+
+
+def test_source_hash_tracks_inputs(spec_cache):
+    """Test editing app sources or descriptions changes the cache key."""
+    root = generate_openapi.ROOT
+    key = source_hash()
+
+    (root / "app" / "main.py").write_text("app = 1\n")
+    edited_app = source_hash()
+    assert edited_app != key
+
+    (generate_openapi.DESCRIPTIONS_DIR / "live.md").write_text("Live!\n")
+    assert source_hash() != edited_app
+
+
+def test_source_hash_tracks_encoder(spec_cache, monkeypatch):
+    """Test output from a different serializer is never replayed."""
+    pytest.importorskip("orjson")
+    key = source_hash()
+    monkeypatch.setattr(generate_openapi, "orjson", None)
+    assert source_hash() != key
+
+
+def test_main_no_cache(tmp_path, spec_cache):
+    """Test --no-cache neither reads nor writes the cache."""
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    stale = cache_dir / f"{source_hash()}.json"
+    stale.write_bytes(b"{}")
+    output = tmp_path / "openapi.json"
+
+    main(["--no-cache", "-o", str(output)])
+    assert len(spec_cache) == 1
+    assert output.read_bytes() != b"{}\n"
+    assert list(cache_dir.iterdir()) == [stale]
+    assert stale.read_bytes() == b"{}"
+
+
+def test_main_output_matches_stdout(tmp_path, spec_cache, capsysbinary):
+    """Test -o writes the same bytes as stdout, trailing newline included."""
+    output = tmp_path / "openapi.json"
+    main([])
+    stdout = capsysbinary.readouterr().out
+    main(["-o", str(output)])
+
+    assert output.read_bytes() == stdout
+    assert stdout.endswith(b"}\n")
+
+
+def test_main_msgpack_has_no_newline(tmp_path, spec_cache):
+    """Test --format msgpack writes the packed spec without a newline."""
+    msgpack = pytest.importorskip("msgpack")
+    output = tmp_path / "openapi.msgpack"
+    main(["--format", "msgpack", "-o", str(output)])
+
+    spec = generate_openapi_spec()
+    data = output.read_bytes()
+    assert msgpack.unpackb(data) == spec
+    # Exactly the packed (key-sorted) spec, with nothing appended
+    assert data == serialize_msgpack(json.loads(serialize_spec(spec)))
+
+
+def test_main_minify_not_cached(tmp_path, spec_cache):
+    """Test --minify output is derived per run and never cached."""
+    minified = tmp_path / "openapi.min.json"
+    main(["--minify", "-o", str(minified)])
+
+    (cached,) = (tmp_path / "cache").glob("*.json")
+    assert cached.read_bytes() == serialize_spec(generate_openapi_spec())
+    assert minified.read_bytes() != cached.read_bytes() + b"\n"
@@ -1,9 +1,6 @@
 """Tests for the interactive endpoints."""
 
-import pytest
 
-
-@pytest.mark.asyncio
 async def test_believe_engine(client, sample_believe_request):
     """Test the Believe Engine endpoint."""
     response = await client.post("/believe", json=sample_believe_request)
@@ -17,7 +14,6 @@ async def test_believe_engine(client, sample_believe_request):
     assert 0 <= data["believe_score"] <= 100
 
 
-@pytest.mark.asyncio
 async def test_believe_engine_easter_egg(client):
     """Test the 418 easter egg when believing too much."""
     request = {
@@ -31,7 +27,6 @@ async def test_believe_engine_easter_egg(client):
     assert "I'm a Believer" in data.get("status", "")
 
 
-@pytest.mark.asyncio
 async def test_believe_engine_too_negative(client):
     """Test the 429 error for too much negativity."""
     request = {
@@ -45,7 +40,6 @@ async def test_believe_engine_too_negative(client):
     assert "Too Much Negativity" in data["detail"]["error"]
 
 
-@pytest.mark.asyncio
 async def test_conflict_resolution(client, sample_conflict_request):
     """Test the conflict resolution endpoint."""
     response = await client.post("/conflicts/resolve", json=sample_conflict_request)
@@ -59,7 +53,6 @@ async def test_conflict_resolution(client, sample_conflict_request):
     assert "barbecue_sauce_wisdom" in data
 
 
-@pytest.mark.asyncio
 async def test_conflict_resolution_judgmental(client):
     """Test the 403 error for judgmental language."""
     request = {
@@ -73,7 +66,6 @@ async def test_conflict_resolution_judgmental(client):
     assert "Judgment Without Curiosity" in data["detail"]["error"]
 
 
-@pytest.mark.asyncio
 async def test_reframe_thought(client, sample_reframe_request):
     """Test the reframe endpoint."""
     response = await client.post("/reframe", json=sample_reframe_request)
@@ -87,7 +79,6 @@ async def test_reframe_thought(client, sample_reframe_request):
     assert "dr_sharon_insight" in data
 
 
-@pytest.mark.asyncio
 async def test_reframe_thought_not_recurring(client):
     """Test reframe without recurring flag."""
     request = {
@@ -100,7 +91,6 @@ async def test_reframe_thought_not_recurring(client):
     assert data.get("dr_sharon_insight") is None
 
 
-@pytest.mark.asyncio
 async def test_press_conference(client, sample_press_request):
     """Test the press conference simulator."""
     response = await client.post("/press", json=sample_press_request)
@@ -112,7 +102,6 @@ async def test_press_conference(client, sample_press_request):
     assert "follow_up_dodge" in data
 
 
-@pytest.mark.asyncio
 async def test_press_conference_hostile(client):
     """Test press conference with hostile question."""
     request = {
@@ -126,7 +115,6 @@ async def test_press_conference_hostile(client):
     assert data["deflection_humor"] is not None
 
 
-@pytest.mark.asyncio
 async def test_get_coaching_principles(client):
     """Test getting all coaching principles."""
     response = await client.get("/coaching/principles")
@@ -144,7 +132,6 @@ async def test_get_coaching_principles(client):
     assert "ted_quote" in data[0]
 
 
-@pytest.mark.asyncio
 async def test_get_coaching_principle(client):
     """Test getting a specific coaching principle."""
     response = await client.get("/coaching/principles/principle-001")
@@ -154,14 +141,12 @@ async def test_get_coaching_principle(client):
     assert "principle" in data
 
 
-@pytest.mark.asyncio
 async def test_get_coaching_principle_not_found(client):
     """Test getting a non-existent principle."""
     response = await client.get("/coaching/principles/nonexistent")
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_get_biscuits(client):
     """Test getting all biscuits."""
     response = await client.get("/biscuits")
@@ -179,7 +164,6 @@ async def test_get_biscuits(client):
     assert "ted_note" in data[0]
 
 
-@pytest.mark.asyncio
 async def test_get_fresh_biscuit(client):
     """Test getting a fresh biscuit."""
     response = await client.get("/biscuits/fresh")
@@ -190,7 +174,6 @@ async def test_get_fresh_biscuit(client):
     assert data["warmth_level"] == 10  # Fresh from the oven!
 
 
-@pytest.mark.asyncio
 async def test_get_specific_biscuit(client):
     """Test getting a specific biscuit."""
     response = await client.get("/biscuits/biscuit-001")
@@ -199,7 +182,6 @@ async def test_get_specific_biscuit(client):
     assert data["id"] == "biscuit-001"
 
 
-@pytest.mark.asyncio
 async def test_get_biscuit_not_found(client):
     """Test getting a non-existent biscuit."""
     response = await client.get("/biscuits/nonexistent")
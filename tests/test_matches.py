@@ -1,11 +1,11 @@
 """Tests for the matches router."""
 
-from datetime import datetime
-
 import pytest
 
+# Fixed kickoff time so created matches are deterministic
+_MATCH_DATE = "2024-01-01T15:00:00"
+
 
-@pytest.mark.asyncio
 async def test_list_matches(client):
     """Test listing all matches."""
     response = await client.get("/matches")
@@ -19,28 +19,25 @@ async def test_list_matches(client):
     assert len(data) > 0
 
 
-@pytest.mark.asyncio
-async def test_list_matches_filter_by_team(client):
-    """Test filtering matches by team."""
-    response = await client.get("/matches?team_id=afc-richmond")
-    assert response.status_code == 200
-    data = response.json()["data"]
-    assert all(
-        m["home_team_id"] == "afc-richmond" or m["away_team_id"] == "afc-richmond"
-        for m in data
-    )
-
-
-@pytest.mark.asyncio
-async def test_list_matches_filter_by_result(client):
-    """Test filtering matches by result."""
-    response = await client.get("/matches?result=draw")
+@pytest.mark.parametrize(
+    ("query", "predicate"),
+    [
+        (
+            "team_id=afc-richmond",
+            lambda m: "afc-richmond" in (m["home_team_id"], m["away_team_id"]),
+        ),
+        ("result=draw", lambda m: m["result"] == "draw"),
+    ],
+    ids=["team", "result"],
+)
+async def test_list_matches_filter(client, query, predicate):
+    """Test filtering matches by team and result."""
+    response = await client.get(f"/matches?{query}")
     assert response.status_code == 200
     data = response.json()["data"]
-    assert all(m["result"] == "draw" for m in data)
+    assert all(predicate(m) for m in data)
 
 
-@pytest.mark.asyncio
 async def test_list_matches_pagination(client):
     """Test pagination parameters."""
     response = await client.get("/matches?limit=2&skip=0")
@@ -51,7 +48,6 @@ async def test_list_matches_pagination(client):
     assert result["skip"] == 0
 
 
-@pytest.mark.asyncio
 async def test_get_match(client):
     """Test getting a specific match."""
     response = await client.get("/matches/match-001")
@@ -62,21 +58,19 @@ async def test_get_match(client):
     assert "lesson_learned" in data
 
 
-@pytest.mark.asyncio
 async def test_get_match_not_found(client):
     """Test getting a non-existent match."""
     response = await client.get("/matches/nonexistent")
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_create_match(client):
     """Test creating a new match."""
     match_data = {
         "home_team_id": "afc-richmond",
         "away_team_id": "tottenham",
         "match_type": "league",
-        "date": datetime.now().isoformat(),
+        "date": _MATCH_DATE,
         "home_score": 0,
         "away_score": 0,
         "result": "pending",
@@ -89,7 +83,6 @@ async def test_create_match(client):
     assert data["id"].startswith("match-")
 
 
-@pytest.mark.asyncio
 async def test_update_match(client):
     """Test updating a match."""
     response = await client.patch(
@@ -101,7 +94,6 @@ async def test_update_match(client):
     assert data["home_score"] == 5
 
 
-@pytest.mark.asyncio
 async def test_update_match_not_found(client):
     """Test updating a non-existent match."""
     response = await client.patch(
@@ -111,7 +103,6 @@ async def test_update_match_not_found(client):
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_get_turning_points(client):
     """Test getting match turning points."""
     response = await client.get("/matches/match-001/turning-points")
@@ -120,7 +111,6 @@ async def test_get_turning_points(client):
     assert isinstance(data, list)
 
 
-@pytest.mark.asyncio
 async def test_get_match_lesson(client):
     """Test getting the lesson from a match."""
     response = await client.get("/matches/match-001/lesson")
@@ -3,7 +3,6 @@
 import pytest
 
 
-@pytest.mark.asyncio
 async def test_list_quotes(client):
     """Test listing all quotes."""
     response = await client.get("/quotes")
@@ -17,46 +16,31 @@ async def test_list_quotes(client):
     assert len(data) > 0
 
 
-@pytest.mark.asyncio
-async def test_list_quotes_filter_by_character(client):
-    """Test filtering quotes by character."""
-    response = await client.get("/quotes?character_id=ted-lasso")
+@pytest.mark.parametrize(
+    ("query", "predicate"),
+    [
+        ("character_id=ted-lasso", lambda q: q["character_id"] == "ted-lasso"),
+        # Theme matches the primary or any secondary theme
+        (
+            "theme=belief",
+            lambda q: "belief" in [q["theme"]] + q.get("secondary_themes", []),
+        ),
+        (
+            "moment_type=press_conference",
+            lambda q: q["moment_type"] == "press_conference",
+        ),
+        ("inspirational=true", lambda q: q["is_inspirational"] is True),
+    ],
+    ids=["character", "theme", "moment_type", "inspirational"],
+)
+async def test_list_quotes_filter(client, query, predicate):
+    """Test filtering quotes by character, theme, moment type and inspiration."""
+    response = await client.get(f"/quotes?{query}")
     assert response.status_code == 200
     data = response.json()["data"]
-    assert all(q["character_id"] == "ted-lasso" for q in data)
-
-
-@pytest.mark.asyncio
-async def test_list_quotes_filter_by_theme(client):
-    """Test filtering quotes by theme."""
-    response = await client.get("/quotes?theme=belief")
-    assert response.status_code == 200
-    data = response.json()["data"]
-    # Check that theme matches primary or secondary
-    for q in data:
-        themes = [q["theme"]] + q.get("secondary_themes", [])
-        assert "belief" in themes
-
-
-@pytest.mark.asyncio
-async def test_list_quotes_filter_by_moment_type(client):
-    """Test filtering quotes by moment type."""
-    response = await client.get("/quotes?moment_type=press_conference")
-    assert response.status_code == 200
-    data = response.json()["data"]
-    assert all(q["moment_type"] == "press_conference" for q in data)
-
-
-@pytest.mark.asyncio
-async def test_list_quotes_filter_inspirational(client):
-    """Test filtering inspirational quotes."""
-    response = await client.get("/quotes?inspirational=true")
-    assert response.status_code == 200
-    data = response.json()["data"]
-    assert all(q["is_inspirational"] is True for q in data)
+    assert all(predicate(q) for q in data)
 
 
-@pytest.mark.asyncio
 async def test_list_quotes_pagination(client):
     """Test pagination parameters."""
     response = await client.get("/quotes?limit=5")
@@ -66,7 +50,6 @@ async def test_list_quotes_pagination(client):
     assert result["limit"] == 5
 
 
-@pytest.mark.asyncio
 async def test_get_random_quote(client):
     """Test getting a random quote."""
     response = await client.get("/quotes/random")
@@ -76,7 +59,6 @@ async def test_get_random_quote(client):
     assert "character_id" in data
 
 
-@pytest.mark.asyncio
 async def test_get_random_quote_filtered(client):
     """Test getting a random filtered quote."""
     response = await client.get("/quotes/random?character_id=ted-lasso")
@@ -85,7 +67,6 @@ async def test_get_random_quote_filtered(client):
     assert data["character_id"] == "ted-lasso"
 
 
-@pytest.mark.asyncio
 async def test_get_quote(client):
     """Test getting a specific quote."""
     response = await client.get("/quotes/quote-001")
@@ -95,14 +76,12 @@ async def test_get_quote(client):
     assert "text" in data
 
 
-@pytest.mark.asyncio
 async def test_get_quote_not_found(client):
     """Test getting a non-existent quote."""
     response = await client.get("/quotes/nonexistent")
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_create_quote(client, sample_quote):
     """Test creating a new quote."""
     response = await client.post("/quotes", json=sample_quote)
@@ -112,7 +91,6 @@ async def test_create_quote(client, sample_quote):
     assert data["id"].startswith("quote-")
 
 
-@pytest.mark.asyncio
 async def test_update_quote(client):
     """Test updating a quote."""
     response = await client.patch(
@@ -124,7 +102,6 @@ async def test_update_quote(client):
     assert data["is_funny"] is True
 
 
-@pytest.mark.asyncio
 async def test_get_quotes_by_theme(client):
     """Test getting quotes by theme."""
     response = await client.get("/quotes/themes/belief")
@@ -136,7 +113,6 @@ async def test_get_quotes_by_theme(client):
     assert len(data) > 0
 
 
-@pytest.mark.asyncio
 async def test_get_character_quotes(client):
     """Test getting all quotes by a character."""
     response = await client.get("/quotes/characters/ted-lasso")
@@ -1,9 +1,6 @@
 """Tests for root endpoints."""
 
-import pytest
 
-
-@pytest.mark.asyncio
 async def test_root_endpoint(client):
     """Test the root welcome endpoint."""
     response = await client.get("/")
@@ -15,7 +12,6 @@ async def test_root_endpoint(client):
     assert "ted_says" in data
 
 
-@pytest.mark.asyncio
 async def test_health_check(client):
     """Test the health check endpoint."""
     response = await client.get("/health")
@@ -25,7 +21,6 @@ async def test_health_check(client):
     assert "believe_level" in data
 
 
-@pytest.mark.asyncio
 async def test_404_handler(client):
     """Test custom 404 error handler."""
     response = await client.get("/this-endpoint-does-not-exist")
@@ -2,10 +2,7 @@
 
 import json
 
-import pytest
 
-
-@pytest.mark.asyncio
 async def test_get_pep_talk(client):
     """Test the pep talk endpoint (non-streaming)."""
     response = await client.get("/pep-talk")
@@ -23,7 +20,6 @@ async def test_get_pep_talk(client):
     assert "is_final" in first_chunk
 
 
-@pytest.mark.asyncio
 async def test_stream_pep_talk(client):
     """Test the pep talk SSE stream."""
     async with client.stream("GET", "/pep-talk?stream=true") as response:
@@ -46,7 +42,6 @@ async def test_stream_pep_talk(client):
         assert "is_final" in chunks[0]
 
 
-@pytest.mark.asyncio
 async def test_stream_match_commentary(client):
     """Test the match commentary SSE stream."""
     async with client.stream(
@@ -72,7 +67,6 @@ async def test_stream_match_commentary(client):
         assert "commentary" in events[0]
 
 
-@pytest.mark.asyncio
 async def test_stream_match_commentary_new_match(client):
     """Test streaming commentary for a new match ID."""
     async with client.stream(
@@ -91,17 +85,18 @@ async def test_stream_match_commentary_new_match(client):
         assert len(events) >= 1
 
 
-@pytest.mark.asyncio
 async def test_stream_test_endpoint(client):
     """Test the SSE test endpoint."""
     async with client.stream("GET", "/stream/test") as response:
         assert response.status_code == 200
 
-        messages = []
-        async for line in response.aiter_lines():
-            if line.startswith("data:"):
-                data = json.loads(line[5:].strip())
-                messages.append(data)
+        # The stream is finite, so read it whole and parse the frames in one pass
+        body = await response.aread()
+        messages = [
+            json.loads(line[5:].strip())
+            for line in body.decode().splitlines()
+            if line.startswith("data:")
+        ]
 
         # Should have all 6 test messages
         assert len(messages) == 6
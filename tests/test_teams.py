@@ -3,7 +3,6 @@
 import pytest
 
 
-@pytest.mark.asyncio
 async def test_list_teams(client):
     """Test listing all teams."""
     response = await client.get("/teams")
@@ -22,25 +21,22 @@ async def test_list_teams(client):
     assert "AFC Richmond" in names
 
 
-@pytest.mark.asyncio
-async def test_list_teams_filter_by_league(client):
-    """Test filtering teams by league."""
-    response = await client.get("/teams?league=Premier League")
+@pytest.mark.parametrize(
+    ("query", "predicate"),
+    [
+        ("league=Premier League", lambda t: t["league"] == "Premier League"),
+        ("min_culture_score=80", lambda t: t["culture_score"] >= 80),
+    ],
+    ids=["league", "culture"],
+)
+async def test_list_teams_filter(client, query, predicate):
+    """Test filtering teams by league and minimum culture score."""
+    response = await client.get(f"/teams?{query}")
     assert response.status_code == 200
     data = response.json()["data"]
-    assert all(t["league"] == "Premier League" for t in data)
+    assert all(predicate(t) for t in data)
 
 
-@pytest.mark.asyncio
-async def test_list_teams_filter_by_culture(client):
-    """Test filtering teams by minimum culture score."""
-    response = await client.get("/teams?min_culture_score=80")
-    assert response.status_code == 200
-    data = response.json()["data"]
-    assert all(t["culture_score"] >= 80 for t in data)
-
-
-@pytest.mark.asyncio
 async def test_list_teams_pagination(client):
     """Test pagination parameters."""
     response = await client.get("/teams?limit=1")
@@ -50,7 +46,6 @@ async def test_list_teams_pagination(client):
     assert result["limit"] == 1
 
 
-@pytest.mark.asyncio
 async def test_get_team(client):
     """Test getting a specific team."""
     response = await client.get("/teams/afc-richmond")
@@ -62,14 +57,12 @@ async def test_get_team(client):
     assert data["values"]["primary_value"] == "Believe"
 
 
-@pytest.mark.asyncio
 async def test_get_team_not_found(client):
     """Test getting a non-existent team."""
     response = await client.get("/teams/nonexistent")
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_create_team(client, sample_team):
     """Test creating a new team."""
     response = await client.post("/teams", json=sample_team)
@@ -79,7 +72,6 @@ async def test_create_team(client, sample_team):
     assert data["id"] == "test-fc"
 
 
-@pytest.mark.asyncio
 async def test_create_team_duplicate(client, sample_team):
     """Test creating a duplicate team fails."""
     # First creation should succeed
@@ -89,7 +81,6 @@ async def test_create_team_duplicate(client, sample_team):
     assert response.status_code == 409
 
 
-@pytest.mark.asyncio
 async def test_update_team(client):
     """Test updating a team."""
     response = await client.patch(
@@ -101,7 +92,6 @@ async def test_update_team(client):
     assert data["culture_score"] == 100
 
 
-@pytest.mark.asyncio
 async def test_update_team_not_found(client):
     """Test updating a non-existent team."""
     response = await client.patch(
@@ -111,7 +101,6 @@ async def test_update_team_not_found(client):
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_get_team_rivals(client):
     """Test getting a team's rivals."""
     response = await client.get("/teams/afc-richmond/rivals")
@@ -120,7 +109,6 @@ async def test_get_team_rivals(client):
     assert isinstance(data, list)
 
 
-@pytest.mark.asyncio
 async def test_get_team_culture(client):
     """Test getting team culture details."""
     response = await client.get("/teams/afc-richmond/culture")
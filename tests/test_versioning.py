@@ -1,7 +1,10 @@
 """Tests for API versioning middleware."""
 
+import re
+
 import pytest
 
+from app.middleware import versioning
 from app.middleware.versioning import (
     DEFAULT_VERSION,
     DEPRECATED_VERSIONS,
@@ -10,28 +13,34 @@ from app.middleware.versioning import (
     _is_valid_date,
 )
 
+_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
 
 class TestVersionHelpers:
     """Tests for version helper functions."""
 
-    def test_is_valid_date_valid(self):
-        """Test valid date formats."""
-        assert _is_valid_date("2026-01-20") is True
-        assert _is_valid_date("2025-12-31") is True
-        assert _is_valid_date("2024-06-15") is True
-
-    def test_is_valid_date_invalid_format(self):
-        """Test invalid date formats."""
-        assert _is_valid_date("invalid") is False
-        assert _is_valid_date("2026-13-01") is False  # Invalid month
-        assert _is_valid_date("2026-00-01") is False  # Invalid month
-        assert _is_valid_date("2026-01-32") is False  # Invalid day
-        assert _is_valid_date("2026-01-00") is False  # Invalid day
-
-    def test_is_valid_date_out_of_range_year(self):
-        """Test years outside valid range."""
-        assert _is_valid_date("2019-01-01") is False  # Too old
-        assert _is_valid_date("2101-01-01") is False  # Too far in future
+    @pytest.mark.parametrize(
+        ("version", "expected"),
+        [
+            ("2026-01-20", True),
+            ("2025-12-31", True),
+            ("2024-06-15", True),
+            ("2028-02-29", True),  # Leap day
+            ("invalid", False),
+            ("2026-13-01", False),  # Invalid month
+            ("2026-00-01", False),  # Invalid month
+            ("2026-01-32", False),  # Invalid day
+            ("2026-01-00", False),  # Invalid day
+            ("2026-02-29", False),  # Not a leap year
+            ("2026-04-31", False),  # 30-day month
+            ("2026-1-020", False),  # Misplaced dash
+            ("2019-01-01", False),  # Too old
+            ("2101-01-01", False),  # Too far in future
+        ],
+    )
+    def test_is_valid_date(self, version, expected):
+        """Test date validation of version strings."""
+        assert _is_valid_date(version) is expected
 
     def test_find_best_version_exact_match(self):
         """Test finding best version with exact match."""
@@ -47,7 +56,6 @@ class TestVersionHelpers:
 class TestVersionMiddlewareResponses:
     """Tests for version middleware HTTP responses."""
 
-    @pytest.mark.asyncio
     async def test_no_version_header_uses_default(self, client):
         """Test that requests without version header use default version."""
         response = await client.get("/")
@@ -55,21 +63,18 @@ class TestVersionMiddlewareResponses:
         assert response.headers.get("X-API-Version") == DEFAULT_VERSION
         assert "X-API-Supported-Versions" in response.headers
 
-    @pytest.mark.asyncio
     async def test_x_api_version_header(self, client):
         """Test X-API-Version header is recognized."""
         response = await client.get("/", headers={"X-API-Version": "2026-01-20"})
         assert response.status_code == 200
         assert response.headers.get("X-API-Version") == "2026-01-20"
 
-    @pytest.mark.asyncio
     async def test_api_version_header_alternative(self, client):
         """Test API-Version header (alternative) is recognized."""
         response = await client.get("/", headers={"API-Version": "2026-01-20"})
         assert response.status_code == 200
         assert response.headers.get("X-API-Version") == "2026-01-20"
 
-    @pytest.mark.asyncio
     async def test_x_api_version_takes_precedence(self, client):
         """Test that X-API-Version takes precedence over API-Version."""
         response = await client.get(
@@ -82,43 +87,24 @@ class TestVersionMiddlewareResponses:
         assert response.status_code == 200
         assert response.headers.get("X-API-Version") == "2026-01-20"
 
-    @pytest.mark.asyncio
-    async def test_invalid_version_format(self, client):
-        """Test that invalid version format returns 400."""
-        response = await client.get("/", headers={"X-API-Version": "invalid"})
+    @pytest.mark.parametrize("version", ["invalid", "1.0.0", "2026-01"])
+    async def test_invalid_version_format(self, client, version):
+        """Test that non-date version formats return 400 (we use dates)."""
+        response = await client.get("/", headers={"X-API-Version": version})
         assert response.status_code == 400
         data = response.json()
         assert "Invalid Version Format" in data["error"]
         assert "supported_versions" in data
         assert "ted_advice" in data
 
-    @pytest.mark.asyncio
-    async def test_invalid_version_format_semantic(self, client):
-        """Test that semantic version format returns 400 (we use dates)."""
-        response = await client.get("/", headers={"X-API-Version": "1.0.0"})
-        assert response.status_code == 400
-
-    @pytest.mark.asyncio
-    async def test_invalid_version_format_partial_date(self, client):
-        """Test that partial date format returns 400."""
-        response = await client.get("/", headers={"X-API-Version": "2026-01"})
-        assert response.status_code == 400
-
-    @pytest.mark.asyncio
-    async def test_invalid_version_date_bad_month(self, client):
-        """Test that invalid month in date returns 400."""
-        response = await client.get("/", headers={"X-API-Version": "2026-13-01"})
+    @pytest.mark.parametrize("version", ["2026-13-01", "2026-01-32"])
+    async def test_invalid_version_date(self, client, version):
+        """Test that an invalid month or day in the date returns 400."""
+        response = await client.get("/", headers={"X-API-Version": version})
         assert response.status_code == 400
         data = response.json()
         assert "Invalid Version Date" in data["error"]
 
-    @pytest.mark.asyncio
-    async def test_invalid_version_date_bad_day(self, client):
-        """Test that invalid day in date returns 400."""
-        response = await client.get("/", headers={"X-API-Version": "2026-01-32"})
-        assert response.status_code == 400
-
-    @pytest.mark.asyncio
     async def test_unsupported_version(self, client):
         """Test that unsupported version returns 406."""
         response = await client.get("/", headers={"X-API-Version": "2099-01-01"})
@@ -129,7 +115,6 @@ class TestVersionMiddlewareResponses:
         assert "default_version" in data
         assert "ted_advice" in data
 
-    @pytest.mark.asyncio
     async def test_supported_versions_header_in_response(self, client):
         """Test that supported versions are included in response headers."""
         response = await client.get("/")
@@ -142,7 +127,6 @@ class TestVersionMiddlewareResponses:
 class TestVersionEndpoint:
     """Tests for the /version endpoint."""
 
-    @pytest.mark.asyncio
     async def test_version_endpoint_returns_info(self, client):
         """Test that /version endpoint returns version information."""
         response = await client.get("/version")
@@ -154,7 +138,6 @@ class TestVersionEndpoint:
         assert "versioning" in data
         assert "ted_says" in data
 
-    @pytest.mark.asyncio
     async def test_version_endpoint_with_header(self, client):
         """Test that /version endpoint respects version header."""
         response = await client.get("/version", headers={"X-API-Version": "2026-01-20"})
@@ -162,7 +145,6 @@ class TestVersionEndpoint:
         data = response.json()
         assert data["current_version"] == "2026-01-20"
 
-    @pytest.mark.asyncio
     async def test_version_endpoint_shows_header_info(self, client):
         """Test that /version endpoint includes header usage information."""
         response = await client.get("/version")
@@ -176,7 +158,6 @@ class TestVersionEndpoint:
 class TestRootEndpointVersionInfo:
     """Tests for version info in root endpoint."""
 
-    @pytest.mark.asyncio
     async def test_root_includes_version_info(self, client):
         """Test that root endpoint includes version information."""
         response = await client.get("/")
@@ -186,7 +167,6 @@ class TestRootEndpointVersionInfo:
         assert "supported_versions" in data
         assert "default_version" in data
 
-    @pytest.mark.asyncio
     async def test_root_version_reflects_header(self, client):
         """Test that root endpoint version reflects request header."""
         response = await client.get("/", headers={"X-API-Version": "2026-01-20"})
@@ -194,11 +174,22 @@ class TestRootEndpointVersionInfo:
         data = response.json()
         assert data["version"] == "2026-01-20"
 
+    async def test_handler_sees_negotiated_version(self, client, monkeypatch):
+        """Test handlers read a non-default negotiated version from request state."""
+        monkeypatch.setattr(
+            versioning,
+            "_SUPPORTED_VERSION_SET",
+            frozenset([*SUPPORTED_VERSIONS, "2025-06-01"]),
+        )
+        response = await client.get("/version", headers={"X-API-Version": "2025-06-01"})
+        assert response.status_code == 200
+        assert response.headers["X-API-Version"] == "2025-06-01"
+        assert response.json()["current_version"] == "2025-06-01"
+
 
 class TestVersioningAcrossEndpoints:
     """Tests for versioning behavior across different endpoints."""
 
-    @pytest.mark.asyncio
     async def test_versioning_on_teams_endpoint(self, client):
         """Test that versioning works on /teams endpoint."""
         response = await client.get(
@@ -208,7 +199,6 @@ class TestVersioningAcrossEndpoints:
         assert response.status_code == 200
         assert response.headers.get("X-API-Version") == "2026-01-20"
 
-    @pytest.mark.asyncio
     async def test_versioning_on_health_endpoint(self, client):
         """Test that versioning works on /health endpoint."""
         response = await client.get(
@@ -218,7 +208,18 @@ class TestVersioningAcrossEndpoints:
         assert response.status_code == 200
         assert response.headers.get("X-API-Version") == "2026-01-20"
 
-    @pytest.mark.asyncio
+    async def test_versioning_on_sse_stream(self, client):
+        """Test that streaming responses still carry the version headers."""
+        async with client.stream(
+            "GET", "/stream/test", headers={"X-API-Version": "2026-01-20"}
+        ) as response:
+            assert response.status_code == 200
+            assert "text/event-stream" in response.headers["content-type"]
+            assert response.headers.get("X-API-Version") == "2026-01-20"
+            assert response.headers.get("X-API-Supported-Versions") == ", ".join(
+                SUPPORTED_VERSIONS
+            )
+
     async def test_invalid_version_blocked_before_endpoint(self, client):
         """Test that invalid version is blocked before reaching endpoint."""
         response = await client.get(
@@ -227,7 +228,6 @@ class TestVersioningAcrossEndpoints:
         )
         assert response.status_code == 400
 
-    @pytest.mark.asyncio
     async def test_unsupported_version_blocked_before_endpoint(self, client):
         """Test that unsupported version is blocked before reaching endpoint."""
         response = await client.get(
@@ -255,11 +255,8 @@ class TestVersionConstants:
 
     def test_versions_are_date_format(self):
         """Test that all versions use YYYY-MM-DD format."""
-        import re
-
-        date_pattern = re.compile(r"^\d{4}-\d{2}-\d{2}$")
         for version in SUPPORTED_VERSIONS:
-            assert date_pattern.match(version), (
+            assert _DATE_PATTERN.match(version), (
                 f"Version {version} is not in YYYY-MM-DD format"
             )
-        assert date_pattern.match(DEFAULT_VERSION)
+        assert _DATE_PATTERN.match(DEFAULT_VERSION)
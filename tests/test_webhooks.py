@@ -0,0 +1,195 @@
+"""Tests for the webhooks router and service."""
+
+import base64
+import hashlib
+import hmac
+
+import httpx
+import pytest
+
+from app.models.webhooks import RegisteredWebhook
+from app.services import webhook_service
+
+
+async def test_register_webhook(client):
+    """Test registering a webhook endpoint."""
+    response = await client.post(
+        "/webhooks",
+        json={"url": "https://example.com/hooks", "description": "Test hook"},
+    )
+    assert response.status_code == 200
+    webhook = response.json()["webhook"]
+    assert webhook["id"].startswith("wh_")
+    assert webhook["secret"].startswith("whsec_")
+    assert set(webhook["event_types"]) == {
+        "match.completed",
+        "team_member.transferred",
+    }
+
+
+async def test_get_webhook_not_found(client):
+    """Test getting a non-existent webhook."""
+    response = await client.get("/webhooks/wh_nonexistent")
+    assert response.status_code == 404
+
+
+async def test_delete_webhook(client):
+    """Test deleting a webhook endpoint."""
+    response = await client.post(
+        "/webhooks",
+        json={"url": "https://example.com/delete-me"},
+    )
+    webhook_id = response.json()["webhook"]["id"]
+
+    response = await client.delete(f"/webhooks/{webhook_id}")
+    assert response.status_code == 200
+
+    response = await client.get(f"/webhooks/{webhook_id}")
+    assert response.status_code == 404
+
+
+async def test_webhooks_for_event_index():
+    """Test the per-event subscriber snapshot tracks register/delete."""
+    webhook = await webhook_service.register_webhook(
+        url="https://example.com/matches-only",
+        event_types=["match.completed"],
+    )
+    try:
+        assert webhook in await webhook_service.get_webhooks_for_event(
+            "match.completed"
+        )
+        assert webhook not in await webhook_service.get_webhooks_for_event(
+            "team_member.transferred"
+        )
+
+        snapshot = await webhook_service.get_webhooks_for_event("match.completed")
+        await webhook_service.delete_webhook(webhook.id)
+
+        # Earlier snapshots are immutable; new lookups see the deletion
+        assert webhook in snapshot
+        assert webhook not in await webhook_service.get_webhooks_for_event(
+            "match.completed"
+        )
+    finally:
+        await webhook_service.delete_webhook(webhook.id)
+
+
+@pytest.mark.parametrize("event_type", ["match.completed", "team_member.transferred"])
+def test_generate_sample_payload(event_type):
+    """Test sample payloads get fresh IDs and serialize like validated models."""
+    first = webhook_service.generate_sample_payload(event_type)
+    second = webhook_service.generate_sample_payload(event_type)
+
+    assert first.event_type == event_type
+    assert first.data.model_dump(mode="json") != second.data.model_dump(mode="json")
+    first.data.model_validate(first.data.model_dump())
+
+
+async def test_compute_signature():
+    """Test signatures match HMAC-SHA256 over "{timestamp}.{payload}"."""
+    webhook = await webhook_service.register_webhook(url="https://example.com/signed")
+    await webhook_service.delete_webhook(webhook.id)
+    payload = b'{"event_type":"match.completed"}'
+
+    expected = hmac.new(
+        base64.b64decode(webhook.secret.removeprefix("whsec_")),
+        b"1700000000." + payload,
+        hashlib.sha256,
+    ).digest()
+
+    signature = webhook_service.compute_signature(
+        payload, webhook.signing_key, 1700000000
+    )
+    assert signature == f"v1,{base64.b64encode(expected).decode()}"
+
+
+async def test_round_tripped_webhook_signs_correctly():
+    """Test a webhook rebuilt from a dump derives the same signing key."""
+    webhook = await webhook_service.register_webhook(
+        url="https://example.com/roundtrip"
+    )
+    await webhook_service.delete_webhook(webhook.id)
+
+    copies = [
+        RegisteredWebhook.model_validate(webhook.model_dump()),
+        RegisteredWebhook.model_validate_json(webhook.model_dump_json()),
+    ]
+    for copy in copies:
+        assert copy.signing_key == webhook.signing_key
+        assert webhook_service.compute_signature(
+            b"{}", copy.signing_key, 1700000000
+        ) == webhook_service.compute_signature(b"{}", webhook.signing_key, 1700000000)
+
+
+async def test_set_webhook_store():
+    """Test the service delegates to a pluggable storage backend."""
+    original = webhook_service._store
+    store = webhook_service.InMemoryWebhookStore()
+    webhook_service.set_webhook_store(store)
+    try:
+        webhook = await webhook_service.register_webhook(
+            url="https://example.com/store"
+        )
+        assert await store.get(webhook.id) is webhook
+        assert await webhook_service.list_webhooks() == [webhook]
+    finally:
+        webhook_service.set_webhook_store(original)
+
+    assert await webhook_service.get_webhook(webhook.id) is None
+
+
+async def test_trigger_event_delivers_same_body(monkeypatch):
+    """Test every subscriber gets one body and timestamp, signed per webhook."""
+    sent = []
+
+    async def fake_post(self, url, *, content, headers):
+        sent.append((url, content, headers))
+        return httpx.Response(200)
+
+    monkeypatch.setattr(httpx.AsyncClient, "post", fake_post)
+    original = webhook_service._store
+    webhook_service.set_webhook_store(webhook_service.InMemoryWebhookStore())
+    try:
+        webhooks = [
+            await webhook_service.register_webhook(url=f"https://example.com/{name}")
+            for name in ("first", "second")
+        ]
+        event_id, results = await webhook_service.trigger_event("match.completed")
+    finally:
+        webhook_service.set_webhook_store(original)
+
+    assert [r.success for r in results] == [True, True]
+    assert [url for url, _, _ in sent] == [str(wh.url) for wh in webhooks]
+
+    (_, first_body, first_headers), (_, second_body, second_headers) = sent
+    assert first_body == second_body
+    assert first_headers["webhook-timestamp"] == second_headers["webhook-timestamp"]
+    assert first_headers["webhook-id"] == second_headers["webhook-id"] == event_id
+
+    for webhook, (_, body, headers) in zip(webhooks, sent, strict=True):
+        expected = hmac.new(
+            base64.b64decode(webhook.secret.removeprefix("whsec_")),
+            f"{headers['webhook-timestamp']}.".encode() + body,
+            hashlib.sha256,
+        ).digest()
+        assert headers["webhook-signature"] == (
+            f"v1,{base64.b64encode(expected).decode()}"
+        )
+
+
+async def test_trigger_event_without_subscribers(monkeypatch):
+    """Test an event nobody subscribes to is not serialized or delivered."""
+
+    def fail_dumps(*args, **kwargs):
+        raise AssertionError("payload serialized without subscribers")
+
+    monkeypatch.setattr(webhook_service.json, "dumps", fail_dumps)
+    original = webhook_service._store
+    webhook_service.set_webhook_store(webhook_service.InMemoryWebhookStore())
+    try:
+        event_id, results = await webhook_service.trigger_event("match.completed")
+    finally:
+        webhook_service.set_webhook_store(original)
+
+    assert event_id.startswith("evt_")
+    assert results == []
@@ -1,15 +1,23 @@
 """Tests for WebSocket live match simulation."""
 
+import pytest
 from fastapi.testclient import TestClient
 
-from app.main import app
+from app.models.websocket import SetSpeedMessage
 
-client = TestClient(app)
 
+@pytest.fixture(scope="module")
+def ws_client():
+    """Create a sync test client whose portal is shared by the module."""
+    from app.main import app
 
-def test_websocket_test_endpoint():
+    with TestClient(app) as client:
+        yield client
+
+
+def test_websocket_test_endpoint(ws_client):
     """Test the simple WebSocket test endpoint."""
-    with client.websocket_connect("/ws/test") as websocket:
+    with ws_client.websocket_connect("/ws/test") as websocket:
         # Should receive welcome message
         data = websocket.receive_json()
         assert data["type"] == "welcome"
@@ -23,9 +31,9 @@ def test_websocket_test_endpoint():
         assert "ted_says" in data
 
 
-def test_live_match_simulation():
+def test_live_match_simulation(ws_client):
     """Test the live match WebSocket endpoint."""
-    with client.websocket_connect(
+    with ws_client.websocket_connect(
         "/matches/live?home_team=AFC%20Richmond&away_team=West%20Ham&speed=10.0&excitement_level=3"
     ) as websocket:
         # Should receive match start message
@@ -65,9 +73,9 @@ def test_live_match_simulation():
         assert first_event["event_type"] == "match_start"
 
 
-def test_live_match_default_teams():
+def test_live_match_default_teams(ws_client):
     """Test live match with default team names."""
-    with client.websocket_connect("/matches/live?speed=10.0") as websocket:
+    with ws_client.websocket_connect("/matches/live?speed=10.0") as websocket:
         data = websocket.receive_json()
         assert data["type"] == "match_start"
         assert data["home_team"] == "AFC Richmond"
@@ -75,9 +83,9 @@ def test_live_match_default_teams():
         websocket.close()
 
 
-def test_live_match_event_types():
+def test_live_match_event_types(ws_client):
     """Test that various event types are generated."""
-    with client.websocket_connect(
+    with ws_client.websocket_connect(
         "/matches/live?speed=10.0&excitement_level=10"
     ) as websocket:
         # Skip match start message
@@ -97,9 +105,9 @@ def test_live_match_event_types():
         assert "match_start" in event_types_seen
 
 
-def test_live_match_score_tracking():
+def test_live_match_score_tracking(ws_client):
     """Test that scores are tracked correctly across events."""
-    with client.websocket_connect(
+    with ws_client.websocket_connect(
         "/matches/live?speed=10.0&excitement_level=8"
     ) as websocket:
         # Skip match start message
@@ -134,3 +142,9 @@ def test_live_match_score_tracking():
         # Final score in match_end should match last event score
         assert data["final_score"]["home"] == last_score["home"]
         assert data["final_score"]["away"] == last_score["away"]
+
+
+def test_client_messages_validate():
+    """Test deferred client message models still validate on first use."""
+    message = SetSpeedMessage.model_validate({"action": "set_speed", "speed": 2.0})
+    assert message.speed == 2.0